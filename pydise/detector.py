@@ -1,18 +1,25 @@
 """Pydise - Detector."""
 import argparse
 import ast
+import builtins
 import copy
+import hashlib
+import importlib.util
+import json
 import os
+import sys
 import logging
-import linecache
 from glob import glob
 
 # TODO : An ast.Expr may not generate a side effect, but it's hard to distinguish, so
 #        by default an ast.Expr will be defined as a possible side-effect generator.
 PATTERNS_SIDE_EFFECTS = (ast.Expr, ast.Raise, ast.Assert, ast.Delete)
 PATTERNS_IGNORED = ["# no-pydise", "# no_pydise"]
-dict_assign = dict()
-dict_functions = dict()
+PATTERNS_DEFINITIONS = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+# ast.TryStar (python 3.11+) has the same fields as ast.Try.
+PATTERNS_TRY = (ast.Try,) + ((ast.TryStar,) if hasattr(ast, "TryStar") else ())
+# Nodes which may raise an exception, without an explicit ast.Raise.
+PATTERNS_MAY_RAISE = (ast.Import, ast.ImportFrom, ast.Call, ast.Attribute, ast.Subscript, ast.Assert, ast.Delete)
 
 
 class PydiseSideEffects(Exception):
@@ -33,12 +40,150 @@ class PydiseLoadError(Exception):
         super().__init__(self.message)
 
 
-class RewriteName(ast.NodeTransformer):
-    """Class for Rewrite some nodes in an AST Tree."""
+class Symbol(object):
+    """A binding of a name at module scope.
 
-    def visit_Name(self, node):
-        """Replace ast.Name to an ast value."""
-        return dict_assign.get(node.id, node)
+    The value is kept by reference, with the definitions reaching each name it
+    uses at binding time (its def-use chain).
+    """
+
+    _unevaluated = object()
+
+    def __init__(self, name, value=None, reaching=None):
+        """Init a binding, value is None when it can't be known statically."""
+        self.name = name
+        self.value = value
+        self.reaching = reaching if reaching is not None else dict()
+        self.uses = list()
+        self._result = self._unevaluated
+
+    def evaluate(self):
+        """Evaluate the bound value, raise NameError when it's unknown."""
+        if self._result is self._unevaluated:
+            try:
+                if self.value is None or isinstance(self.value, PATTERNS_DEFINITIONS):
+                    raise NameError(self.name)
+                # A call ("a = exit()") is never executed, its result is unknown.
+                if True in [isinstance(x, ast.Call) for x in ast.walk(self.value)]:
+                    raise NameError(self.name)
+                self._result = (
+                    eval(ast.unparse(self.value), get_eval_globals(), SymbolNamespace(self.reaching)),
+                    None,
+                )
+            except Exception as exc:
+                self._result = (None, exc)
+        result, exc = self._result
+        if exc is not None:
+            raise NameError(self.name) from exc
+        return result
+
+
+class SymbolNamespace(object):
+    """Mapping used as eval() locals, resolving names through their definitions."""
+
+    def __init__(self, reaching):
+        """Init with the definitions reaching an expression."""
+        self.reaching = reaching
+        # Names assigned by the expression itself, like "(a := True)"
+        self.assigned = dict()
+
+    def __getitem__(self, name):
+        """Return the value of a bound name, unbound names fall back to builtins."""
+        if name in self.assigned:
+            return self.assigned[name]
+        symbol = self.reaching.get(name)
+        if symbol is None:
+            raise KeyError(name)
+        return symbol.evaluate()
+
+    def __setitem__(self, name, value):
+        """Keep a name assigned during the evaluation."""
+        self.assigned[name] = value
+
+
+class SymbolTable(object):
+    """Module scope symbol table, with def-use chains."""
+
+    def __init__(self):
+        """Init an empty table, each name maps to its bindings in order."""
+        self.symbols = dict()
+        # ast.Name already linked to a binding, a use is recorded once.
+        self.used = set()
+
+    def lookup(self, name):
+        """Return the current binding of a name, or None."""
+        bindings = self.symbols.get(name)
+        return bindings[-1] if bindings else None
+
+    def use(self, ast_name):
+        """Link an ast.Name to its current binding and return it."""
+        symbol = self.lookup(ast_name.id)
+        if symbol is not None and id(ast_name) not in self.used:
+            self.used.add(id(ast_name))
+            symbol.uses.append(ast_name)
+        return symbol
+
+    def get_reaching(self, node):
+        """Return the definitions reaching the names loaded in a node."""
+        reaching = dict()
+        if node is None or isinstance(node, PATTERNS_DEFINITIONS):
+            return reaching
+        for child in ast.walk(node):
+            if isinstance(child, ast.Name) and isinstance(child.ctx, ast.Load):
+                reaching[child.id] = self.use(child)
+        return reaching
+
+    def bind(self, name, value=None, reaching=None):
+        """Bind a name to an ast value (None if unknown) and return the symbol."""
+        if reaching is None:
+            reaching = self.get_reaching(value)
+        symbol = Symbol(name, value=value, reaching=reaching)
+        self.symbols.setdefault(name, list()).append(symbol)
+        return symbol
+
+    def unbind(self, name):
+        """Delete a name, its previous bindings are no longer valid."""
+        return self.bind(name)
+
+    def _resolve(self, node, reaching=None):
+        """Follow a node through aliases, return it with its reaching definitions."""
+        if isinstance(node, ast.Name):
+            if reaching is None:
+                symbol = self.use(node)
+            else:
+                symbol = reaching.get(node.id)
+            if symbol is None or symbol.value is None:
+                return node, reaching
+            return self._resolve(symbol.value, symbol.reaching)
+
+        if isinstance(node, ast.Attribute):
+            owner, owner_reaching = self._resolve(node.value, reaching)
+            # An instance : "obj = Foo()" then "obj.method()"
+            if isinstance(owner, ast.Call):
+                owner, owner_reaching = self._resolve(owner.func, owner_reaching)
+            if isinstance(owner, ast.ClassDef):
+                for body_data in owner.body:
+                    if (
+                        isinstance(body_data, PATTERNS_DEFINITIONS)
+                        and body_data.name == node.attr
+                    ):
+                        return body_data, None
+        return node, reaching
+
+    def resolve(self, node):
+        """Return the ast node bound to a name / an attribute, or the node itself."""
+        return self._resolve(node)[0]
+
+    def evaluate(self, node, code=None):
+        """Evaluate an expression (or the code built from it) with the bound values."""
+        if code is None:
+            code = ast.unparse(node)
+        return eval(code, get_eval_globals(), SymbolNamespace(self.get_reaching(node)))
+
+
+def get_eval_globals():
+    """Return the globals of an evaluation, isolated from the detector module."""
+    return {"__builtins__": builtins}
 
 
 class PyDiseLoader(object):
@@ -51,6 +196,7 @@ class PyDiseLoader(object):
         ast_tree=None,
     ):
         """Init data to load, based on filename / file or an ast_tree."""
+        self.source = None
         if filename:
             self.filename = filename
             self.load_from_filename(filename)
@@ -70,11 +216,20 @@ class PyDiseLoader(object):
         if not os.path.isfile(self.filename):
             print("'{}' isn't a file.")
         with open(self.filename, "rb") as file:
-            self.ast_module = ast.parse(file.read(), filename=self.filename)
+            self.load_from_source(file.read())
 
     def load_from_file(self, file):
         """Load a file, and set an ast_module."""
-        self.ast_module = ast.parse(file.read())
+        self.load_from_source(file.read())
+
+    def load_from_source(self, source):
+        """Load a source (str or bytes), keep it in memory and set an ast_module."""
+        if isinstance(source, bytes):
+            # Honor the encoding cookie, like the interpreter does.
+            source = importlib.util.decode_source(source)
+        self.ast_module = ast.parse(source, filename=self.filename or "<unknown>")
+        # AST column offsets are UTF-8 byte offsets, so keep the encoded source.
+        self.source = source.encode("utf-8")
 
     def load_from_ast(self, ast_tree):
         """Load an ast module."""
@@ -99,6 +254,7 @@ class PyDise(object):
             )
             self.filename = pydise_loader_obj.filename
             self.ast_module = pydise_loader_obj.ast_module
+            self.source = pydise_loader_obj.source
         except SyntaxError:
             raise PydiseLoadError
         self.on_error = on_error
@@ -106,50 +262,187 @@ class PyDise(object):
         if isinstance(patterns_ignored, list):
             self.patterns_ignored.extend(patterns_ignored)
 
+        self.line_offsets = get_line_offsets(self.source)
+        self.symbols = SymbolTable()
+        # Functions / classes currently walked, module scope when empty.
+        self.call_stack = list()
         self.side_effects = {"warnings": list(), "errors": list()}
 
     def save_variables(self, ast_assign):
-        """Save variables into a dictionnary."""
-        if not isinstance(ast_assign, ast.Assign):
+        """Save variables into the symbol table."""
+        if isinstance(ast_assign, ast.AugAssign):
+            if isinstance(ast_assign.target, ast.Name):
+                # "a += 1" is bound as "a = <previous a> + 1", the target reads the previous a
+                reaching = self.symbols.get_reaching(ast_assign.value)
+                reaching[ast_assign.target.id] = self.symbols.use(ast_assign.target)
+                value = ast.BinOp(
+                    left=ast.Name(id=ast_assign.target.id, ctx=ast.Load()),
+                    op=ast_assign.op,
+                    right=ast_assign.value,
+                )
+                self.symbols.bind(ast_assign.target.id, value, reaching=reaching)
+        elif isinstance(ast_assign, ast.Assign):
+            for target in ast_assign.targets:
+                self.save_target(target, ast_assign.value)
+        elif isinstance(ast_assign, ast.AnnAssign):
+            if ast_assign.value is not None:
+                self.save_target(ast_assign.target, ast_assign.value)
+        else:
             logging.error("Not an AST Assign.")
 
-        for target in ast_assign.targets:
-            if hasattr(target, "id"):
-                dict_assign[target.id] = ast_assign.value
+    def save_target(self, target, value):
+        """Bind an assignment target, unpacking tuples / lists when possible."""
+        if isinstance(target, ast.Name):
+            self.symbols.bind(target.id, value)
+        elif isinstance(target, (ast.Tuple, ast.List)):
+            if (
+                isinstance(value, (ast.Tuple, ast.List))
+                and len(value.elts) == len(target.elts)
+                and not any(isinstance(x, ast.Starred) for x in target.elts)
+                and not any(isinstance(x, ast.Starred) for x in value.elts)
+            ):
+                for sub_target, sub_value in zip(target.elts, value.elts):
+                    self.save_target(sub_target, sub_value)
+            else:
+                # Unknown values, but the previous bindings are no longer valid.
+                for child in ast.walk(target):
+                    if isinstance(child, ast.Name):
+                        self.symbols.bind(child.id)
+        elif isinstance(target, ast.Starred):
+            self.save_target(target.value, None)
+
+    def save_named_exprs(self, ast_stmt):
+        """Save the targets of the "(a := value)" of a statement into the symbol table."""
+        for field, value in ast.iter_fields(ast_stmt):
+            # Expressions only, the sub statements are saved when visited.
+            list_values = value if isinstance(value, list) else [value]
+            for sub_value in list_values:
+                if not isinstance(sub_value, ast.expr):
+                    continue
+                list_nodes = [sub_value]
+                while list_nodes:
+                    child = list_nodes.pop()
+                    if isinstance(child, ast.NamedExpr):
+                        self.symbols.bind(child.target.id, child.value)
+                    # Unlike a comprehension, a lambda keeps its walrus targets local.
+                    if not isinstance(child, ast.Lambda):
+                        list_nodes.extend(reversed(list(ast.iter_child_nodes(child))))
+
+    def delete_variables(self, ast_delete):
+        """Remove the deleted names from the symbol table."""
+        if not isinstance(ast_delete, ast.Delete):
+            logging.error("Not an AST Delete.")
+        for target in ast_delete.targets:
+            for child in ast.walk(target):
+                if isinstance(child, ast.Name) and isinstance(child.ctx, ast.Del):
+                    self.symbols.unbind(child.id)
+
+    def save_loop_target(self, ast_for):
+        """Bind a loop target to its last value when it's a constant, else as unknown."""
+        is_break = True in [isinstance(x, ast.Break) for x in ast.walk(ast_for)]
+        if isinstance(ast_for.target, ast.Name) and not is_break:
+            loop_var = ast_for.target.id
+            try:
+                last_value = self.symbols.evaluate(
+                    ast_for.iter, f"[{loop_var} for {loop_var} in {ast.unparse(ast_for.iter)}][-1]"
+                )
+                is_constant = last_value is None or isinstance(last_value, (bool, int, float, str, bytes))
+            except Exception:
+                is_constant = False
+            if is_constant:
+                self.symbols.bind(loop_var, ast.Constant(value=last_value))
+                return
+        self.save_target(ast_for.target, None)
+
+    def save_imports(self, ast_import):
+        """Save imported names into the symbol table, their values are unknown."""
+        if not isinstance(ast_import, (ast.Import, ast.ImportFrom)):
+            logging.error("Not an AST Import or ImportFrom.")
+        for alias in ast_import.names:
+            if alias.name != "*":
+                self.symbols.bind(alias.asname or alias.name.split(".")[0])
 
     def save_functions(self, ast_def):
-        """Save functions / class to a dictionnary."""
+        """Save functions / class into the symbol table."""
         # TODO : Improve this method to retrieve sub function
-        if not isinstance(ast_def, (ast.FunctionDef, ast.ClassDef)):
+        if not isinstance(ast_def, PATTERNS_DEFINITIONS):
             logging.error("Not an AST FunctionDef or ClassDef.")
-        dict_functions[ast_def.name] = ast_def
+        self.symbols.bind(ast_def.name, ast_def)
 
-    def _notify(self, tree_element, level=logging.ERROR, on_error=None):
-        """Notifying assertion."""
-        raw_line = linecache.getline(
-            self.filename, tree_element.lineno, module_globals=None
+    def walk_call(self, ast_def):
+        """Dig into a called function / class, once per call stack."""
+        if ast_def in self.call_stack:
+            return
+        self.call_stack.append(ast_def)
+        try:
+            self.get_side_effects(ast_def, recursive=True)
+        finally:
+            self.call_stack.pop()
+
+    def get_raw_line(self, lineno):
+        """Return the raw source line, read from the in-memory source."""
+        if self.source is None or not 0 < lineno < len(self.line_offsets):
+            return ""
+        start = self.line_offsets[lineno - 1]
+        end = self.line_offsets[lineno]
+        return self.source[start:end].decode("utf-8", errors="replace")
+
+    def get_source_segment(self, tree_element):
+        """Return the exact source text spanned by an ast node."""
+        if self.source is None or getattr(tree_element, "end_lineno", None) is None:
+            return ast.unparse(tree_element)
+        start = self.line_offsets[tree_element.lineno - 1] + tree_element.col_offset
+        end = (
+            self.line_offsets[tree_element.end_lineno - 1]
+            + tree_element.end_col_offset
         )
-        message = f"{self.filename}:{tree_element.lineno} -> Side effects detected : {raw_line}"
+        return self.source[start:end].decode("utf-8", errors="replace")
+
+    def get_span(self, tree_element):
+        """Return the location of an ast node and its source segment."""
+        return {
+            "filename": self.filename,
+            "lineno": tree_element.lineno,
+            "col_offset": tree_element.col_offset,
+            "end_lineno": getattr(tree_element, "end_lineno", None),
+            "end_col_offset": getattr(tree_element, "end_col_offset", None),
+            "segment": self.get_source_segment(tree_element),
+        }
+
+    def get_findings(self):
+        """Return the side effects as a list of spans, warnings first."""
+        findings = list()
+        for level, key in ((logging.WARNING, "warnings"), (logging.ERROR, "errors")):
+            tree_elements = sorted(
+                set(self.side_effects.get(key, list())),
+                key=lambda x: (x.lineno, x.col_offset),
+            )
+            for tree_element in tree_elements:
+                finding = self.get_span(tree_element)
+                finding["level"] = logging.getLevelName(level)
+                findings.append(finding)
+        return findings
+
+    def _notify(self, finding, on_error=None):
+        """Notifying assertion."""
+        message = format_finding(finding)
 
         if on_error == "logger":
-            logging.log(level, message)
+            logging.log(logging.getLevelName(finding["level"]), message)
         elif on_error == "raise":
             raise PydiseSideEffects(message)
         else:
             pass
 
-    def notify(self, on_error=None):
-        """Use to notify user."""
+    def notify(self, on_error=None, findings=None):
+        """Use to notify user, findings are computed when not given."""
         if on_error is None:
             on_error = self.on_error
-        side_effects_warnings = list(set(self.side_effects.get("warnings", list())))
-        side_effects_errors = list(set(self.side_effects.get("errors", list())))
-
-        for side_effect in side_effects_warnings:
-            self._notify(side_effect, level=logging.WARNING, on_error=on_error)
+        if findings is None:
+            findings = self.get_findings()
 
-        for side_effect in side_effects_errors:
-            self._notify(side_effect, level=logging.ERROR, on_error=on_error)
+        for finding in findings:
+            self._notify(finding, on_error=on_error)
 
     def analyze(self, ast_module=None):
         """Analyze the AST Module.
@@ -164,7 +457,6 @@ class PyDise(object):
             tree_elements = ast_module.body
 
             for tree_element in tree_elements:
-                tree_element = RewriteName().visit(tree_element)
                 self.get_side_effects(tree_element)
         return self.side_effects
 
@@ -172,13 +464,13 @@ class PyDise(object):
         """Check if the ast node could generate a side effect."""
         if isinstance(node, PATTERNS_SIDE_EFFECTS):
             # When ast.Expr(value=ast.Constant) assuming it's a docstring -> Ignored
-            if hasattr(node, "value") and isinstance(node.value, ast.Constant):
+            if hasattr(node, "value") and isinstance(
+                self.symbols.resolve(node.value), ast.Constant
+            ):
                 return False
 
             # Exclusion based on a line pattern
-            raw_line = linecache.getline(
-                self.filename, node.lineno, module_globals=None
-            )
+            raw_line = self.get_raw_line(node.lineno)
             for pattern_ignored in self.patterns_ignored:
                 if pattern_ignored in raw_line:
                     return False
@@ -186,14 +478,11 @@ class PyDise(object):
 
     def get_side_effects(self, tree_element, recursive=False):
         """Recursively dig into an ast tree and found side effects."""
-        # TODO : Add "try/finally"
-        # TODO : Add "match"
-
         if self.is_side_effects(tree_element):
             self.side_effects["errors"].append(tree_element)
 
         # Save the first level functions / class.
-        if isinstance(tree_element, (ast.FunctionDef, ast.ClassDef)):
+        if isinstance(tree_element, PATTERNS_DEFINITIONS) and not self.call_stack:
             self.save_functions(tree_element)
 
         if isinstance(tree_element, ast.FunctionDef):
@@ -213,45 +502,72 @@ class PyDise(object):
                     self.get_side_effects(sub_element)
 
             # For object Assign()
-            if hasattr(tree_element, "targets"):
-                function_name = tree_element.value.func.id
-                if dict_functions.get(function_name):
-                    self.get_side_effects(dict_functions.get(function_name))
+            if hasattr(tree_element, "targets") and isinstance(getattr(tree_element, "value", None), ast.Call):
+                self.get_side_effects(tree_element.value)
         else:
+            if isinstance(tree_element, ast.stmt) and not self.call_stack:
+                self.save_named_exprs(tree_element)
+
             if isinstance(tree_element, ast.Call):
-                if hasattr(tree_element, "func") and hasattr(tree_element.func, "id"):
-                    dest_call = dict_functions.get(tree_element.func.id)
-                    if isinstance(dest_call, ast.ClassDef):
-                        for body_data in dest_call.body:
-                            if (
-                                hasattr(body_data, "name")
-                                and body_data.name == "__init__"
-                            ):
-                                self.get_side_effects(body_data, recursive=True)
-                    else:
-                        self.get_side_effects(dest_call, recursive=True)
-
-            if isinstance(tree_element, ast.Assign):
+                # Aliases ("log = foo") and methods ("obj.method") are resolved
+                dest_call = self.symbols.resolve(tree_element.func)
+                if isinstance(dest_call, ast.ClassDef):
+                    for body_data in dest_call.body:
+                        if (
+                            hasattr(body_data, "name")
+                            and body_data.name == "__init__"
+                        ):
+                            self.walk_call(body_data)
+                elif isinstance(dest_call, ast.FunctionDef):
+                    self.walk_call(dest_call)
+
+            if isinstance(tree_element, (ast.Assign, ast.AugAssign, ast.AnnAssign)):
                 for child in list(ast.iter_child_nodes(tree_element)):
                     # catch dynamic assignment like "a = foo()" and check if this functions could generate a side effects
                     if isinstance(child, ast.Call):
                         self.get_side_effects(child)
                 else:
-                    self.save_variables(tree_element)
+                    # Only the module scope is tracked
+                    if not self.call_stack:
+                        self.save_variables(tree_element)
+
+            if isinstance(tree_element, (ast.Import, ast.ImportFrom)) and not self.call_stack:
+                self.save_imports(tree_element)
+
+            if isinstance(tree_element, ast.Delete) and not self.call_stack:
+                self.delete_variables(tree_element)
 
             # if isinstance(tree_element, (ast.ClassDef, ast.Try, ast.With)):
-            if isinstance(tree_element, (ast.Try, ast.With)):
+            if isinstance(tree_element, (ast.With, ast.AsyncWith)):
+                if not self.call_stack:
+                    for item in tree_element.items:
+                        if item.optional_vars is not None:
+                            self.save_target(item.optional_vars, None)
                 self.get_side_effects(tree_element, recursive=True)
 
-            if isinstance(tree_element, ast.For):
+            if isinstance(tree_element, PATTERNS_TRY):
+                self.get_try_side_effects(tree_element)
+
+            if hasattr(ast, "Match") and isinstance(tree_element, ast.Match):
+                self.get_match_side_effects(tree_element)
+
+            if isinstance(tree_element, (ast.For, ast.AsyncFor)):
                 loop_var = ast.unparse(tree_element.target)
                 loop_iter = ast.unparse(tree_element.iter)
 
                 try:
-                    eval_code = eval(f"[True for {loop_var} in {loop_iter}]")
+                    eval_code = self.symbols.evaluate(
+                        tree_element.iter, f"[True for {loop_var} in {loop_iter}]"
+                    )
                     eval_code = True if True in eval_code else False
+                    is_empty = not eval_code
                 except Exception:
                     eval_code = False
+                    is_empty = False
+
+                # The loop variable is rebound, unless the loop is never executed.
+                if not is_empty and not self.call_stack:
+                    self.save_loop_target(tree_element)
 
                 if eval_code:
                     self.get_side_effects(tree_element, recursive=True)
@@ -271,13 +587,13 @@ class PyDise(object):
 
             if isinstance(tree_element, (ast.If, ast.While)):
                 # Skip test when it's a function / object
-                if isinstance(tree_element.test, ast.Call):
+                if isinstance(self.symbols.resolve(tree_element.test), ast.Call):
                     # self.side_effects["warnings"].append(f"Possible side-effect - {tree_element.lineno}")
                     self.side_effects["warnings"].append(tree_element.test)
                 else:
                     unparse_code = ast.unparse(tree_element.test)
                     try:
-                        eval_code = eval(unparse_code)
+                        eval_code = self.symbols.evaluate(tree_element.test)
                     except Exception:
                         eval_code = False
 
@@ -291,6 +607,257 @@ class PyDise(object):
 
         return self.side_effects
 
+    def get_try_side_effects(self, tree_element):
+        """Dig into a try statement, only in the blocks that can be executed."""
+        # Checked before the body binds its names, "a = a" may raise a NameError.
+        is_may_raise = self.may_raise(tree_element.body)
+        self.get_side_effects(tree_element, recursive=True)
+        # When the body raises, an handler is executed instead of the "else".
+        list_raise = self.get_raises(tree_element.body)
+
+        list_handlers = list()
+        for ast_raise in list_raise:
+            for handler in tree_element.handlers:
+                is_handled = self.is_handled(ast_raise, handler)
+                if is_handled is not False and handler not in list_handlers:
+                    list_handlers.append(handler)
+                # The first handler which matches is the only one executed.
+                if is_handled:
+                    break
+
+        for handler in tree_element.handlers:
+            # When the body may raise, any handler may be executed.
+            if handler not in list_handlers and not is_may_raise:
+                continue
+            if handler.name and not self.call_stack:
+                self.symbols.bind(handler.name)
+            for sub_element in handler.body:
+                self.get_side_effects(sub_element)
+            # "except ... as name" deletes the name at the end of the handler.
+            if handler.name and not self.call_stack:
+                self.symbols.unbind(handler.name)
+
+        if not list_raise:
+            for sub_element in tree_element.orelse:
+                self.get_side_effects(sub_element)
+
+        for sub_element in tree_element.finalbody:
+            self.get_side_effects(sub_element)
+
+    def may_raise(self, statements):
+        """Check if a list of statements may raise an exception, without an explicit raise."""
+        list_nodes = list(statements)
+        while list_nodes:
+            node = list_nodes.pop()
+            # The explicit raises are matched with the handlers, a function body isn't executed.
+            if isinstance(node, (ast.Raise, ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda)):
+                continue
+            if isinstance(node, PATTERNS_MAY_RAISE):
+                return True
+            if (
+                isinstance(node, ast.Name)
+                and isinstance(node.ctx, ast.Load)
+                and self.symbols.lookup(node.id) is None
+                and not hasattr(builtins, node.id)
+            ):
+                return True
+            list_nodes.extend(ast.iter_child_nodes(node))
+        return False
+
+    def is_test_true(self, test):
+        """Evaluate a test like an "if" statement, a call or an unknown test is False."""
+        if isinstance(self.symbols.resolve(test), ast.Call):
+            return False
+        try:
+            return bool(self.symbols.evaluate(test))
+        except Exception:
+            return False
+
+    def get_raises(self, statements):
+        """Return the ast.Raise which can be reached in a list of statements."""
+        list_raise = list()
+        for statement in statements:
+            if isinstance(statement, ast.Raise):
+                list_raise.append(statement)
+            elif isinstance(statement, (ast.With, ast.AsyncWith)):
+                list_raise.extend(self.get_raises(statement.body))
+            elif isinstance(statement, (ast.If, ast.While)):
+                if self.is_test_true(statement.test):
+                    list_raise.extend(self.get_raises(statement.body))
+                else:
+                    list_raise.extend(self.get_raises(statement.orelse))
+            elif isinstance(statement, ast.For):
+                loop_var = ast.unparse(statement.target)
+                loop_iter = ast.unparse(statement.iter)
+                try:
+                    eval_code = self.symbols.evaluate(
+                        statement.iter, f"[True for {loop_var} in {loop_iter}]"
+                    )
+                    eval_code = True if True in eval_code else False
+                except Exception:
+                    eval_code = False
+                if eval_code:
+                    list_raise.extend(self.get_raises(statement.body))
+                list_raise.extend(self.get_raises(statement.orelse))
+            elif isinstance(statement, PATTERNS_TRY):
+                for sub_statements in (statement.body, statement.orelse, statement.finalbody):
+                    list_raise.extend(self.get_raises(sub_statements))
+            elif hasattr(ast, "Match") and isinstance(statement, ast.Match):
+                for match_case in statement.cases:
+                    list_raise.extend(self.get_raises(match_case.body))
+        return list_raise
+
+    def is_handled(self, ast_raise, handler):
+        """Check if an except handler catches a raise, None when it can't be decided."""
+        if handler.type is None:
+            return True
+        if ast_raise.exc is None:
+            return None
+
+        # Only the exception class is evaluated, a call "ValueError(...)" isn't executed
+        exc = ast_raise.exc.func if isinstance(ast_raise.exc, ast.Call) else ast_raise.exc
+        try:
+            exc_class = self.symbols.evaluate(exc)
+            handler_type = self.symbols.evaluate(handler.type)
+            if not isinstance(exc_class, type):
+                exc_class = type(exc_class)
+            return issubclass(exc_class, handler_type)
+        except Exception:
+            return None
+
+    def get_match_side_effects(self, tree_element):
+        """Dig into a match statement, only in the cases that can match."""
+        # Skip subject when it's a function / object
+        if isinstance(self.symbols.resolve(tree_element.subject), ast.Call):
+            self.side_effects["warnings"].append(tree_element.subject)
+            return
+
+        try:
+            subject = self.symbols.evaluate(tree_element.subject)
+            is_known = True
+        except Exception:
+            subject = None
+            is_known = False
+
+        for match_case in tree_element.cases:
+            if is_known:
+                is_match = self.is_match(match_case.pattern, subject)
+            else:
+                # An unknown subject is handled like an "if", only "case _" is executed
+                is_match = (
+                    isinstance(match_case.pattern, ast.MatchAs)
+                    and match_case.pattern.pattern is None
+                )
+
+            if is_match is False:
+                continue
+
+            if not self.call_stack:
+                self.save_captures(match_case.pattern, tree_element.subject)
+            if match_case.guard is not None:
+                try:
+                    is_guard = self.symbols.evaluate(match_case.guard)
+                except Exception:
+                    is_guard = False
+                if not is_guard:
+                    continue
+
+            for sub_element in match_case.body:
+                self.get_side_effects(sub_element)
+
+            # The first case which matches is the only one executed.
+            if is_match:
+                break
+
+    def is_match(self, pattern, subject):
+        """Check if a pattern matches a subject, None when it can't be decided."""
+        if isinstance(pattern, ast.MatchAs):
+            if pattern.pattern is None:
+                return True
+            return self.is_match(pattern.pattern, subject)
+
+        if isinstance(pattern, ast.MatchSingleton):
+            return subject is pattern.value
+
+        if isinstance(pattern, ast.MatchValue):
+            try:
+                return bool(subject == self.symbols.evaluate(pattern.value))
+            except Exception:
+                return None
+
+        if isinstance(pattern, ast.MatchOr):
+            list_match = [self.is_match(x, subject) for x in pattern.patterns]
+            if True in list_match:
+                return True
+            return None if None in list_match else False
+
+        if isinstance(pattern, ast.MatchSequence):
+            if isinstance(subject, (str, bytes, bytearray)) or not hasattr(subject, "__getitem__"):
+                return False
+            if not isinstance(subject, (list, tuple)):
+                return None
+            if True in [isinstance(x, ast.MatchStar) for x in pattern.patterns]:
+                return None
+            if len(subject) != len(pattern.patterns):
+                return False
+            list_match = [self.is_match(x, y) for x, y in zip(pattern.patterns, subject)]
+            if False in list_match:
+                return False
+            return None if None in list_match else True
+
+        # ast.MatchMapping / ast.MatchClass
+        return None
+
+    def save_captures(self, pattern, subject):
+        """Save the names captured by a case pattern into the symbol table."""
+        if isinstance(pattern, ast.MatchAs):
+            if pattern.pattern is not None:
+                self.save_captures(pattern.pattern, subject)
+            if pattern.name is not None:
+                self.symbols.bind(pattern.name, subject)
+            return
+
+        if isinstance(pattern, ast.MatchSequence):
+            subject_value = self.symbols.resolve(subject)
+            if (
+                isinstance(subject_value, (ast.Tuple, ast.List))
+                and len(subject_value.elts) == len(pattern.patterns)
+                and True not in [isinstance(x, ast.MatchStar) for x in pattern.patterns]
+                and True not in [isinstance(x, ast.Starred) for x in subject_value.elts]
+            ):
+                for sub_pattern, sub_subject in zip(pattern.patterns, subject_value.elts):
+                    self.save_captures(sub_pattern, sub_subject)
+                return
+
+        # Unknown values, but the previous bindings are no longer valid.
+        for child in ast.walk(pattern):
+            name = getattr(child, "name", None) or getattr(child, "rest", None)
+            if isinstance(child, (ast.MatchAs, ast.MatchStar, ast.MatchMapping)) and name:
+                self.symbols.bind(name)
+
+
+def get_line_offsets(source):
+    """Return the byte offset of the start of each line of a source.
+
+    The last item is the length of the source, so line N spans
+    offsets[N - 1]:offsets[N].
+    """
+    line_offsets = [0]
+    if source is None:
+        return line_offsets
+    # bytes.splitlines() only breaks on \n, \r and \r\n, like the tokenizer.
+    for line in source.splitlines(keepends=True):
+        line_offsets.append(line_offsets[-1] + len(line))
+    return line_offsets
+
+
+def format_finding(finding):
+    """Return the message of a finding."""
+    return (
+        f"{finding['filename']}:{finding['lineno']} -> "
+        f"Side effects detected : {finding['segment']}"
+    )
+
 
 def get_filenames(args):
     """Return a list of files based on args or by default, from the current directory."""
@@ -308,21 +875,114 @@ def get_filenames(args):
     return list_files
 
 
-def main(filename, on_error="logger", pattern_ignored=None):
+def parse_shard(value):
+    """Parse a "K/N" shard (1 <= K <= N) into a tuple."""
+    try:
+        index, count = (int(x) for x in value.split("/"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"'{value}' isn't a shard like K/N.")
+    if not 1 <= index <= count:
+        raise argparse.ArgumentTypeError(f"'{value}' : K must be between 1 and N.")
+    return index, count
+
+
+def get_shard(list_files, shard):
+    """Return the files of the shard K/N, split by a stable hash of their path."""
+    index, count = shard
+    list_shard = list()
+    for file in list_files:
+        # Same split on every machine / OS, unlike hash() which is salted.
+        path = os.path.normpath(file).replace(os.sep, "/")
+        digest = hashlib.sha1(path.encode("utf-8")).hexdigest()
+        if int(digest, 16) % count == index - 1:
+            list_shard.append(file)
+    return sorted(list_shard)
+
+
+def write_results(output, findings, list_files=None, shard=None):
+    """Write the findings to a json result file, which can be merged later."""
+    results = {
+        "shard": f"{shard[0]}/{shard[1]}" if shard else None,
+        "files": list_files,
+        "findings": findings,
+    }
+    with open(output, "w") as file:
+        json.dump(results, file, indent=2)
+
+
+def main(filename, on_error="logger", pattern_ignored=None, findings=None):
     """Script main entry point."""
     try:
         pydise_object = PyDise(
             filename=filename, on_error=on_error, patterns_ignored=pattern_ignored
         )
         pydise_object.analyze()
-        pydise_object.notify()
+        file_findings = pydise_object.get_findings()
+        pydise_object.notify(findings=file_findings)
+        if findings is not None:
+            findings.extend(file_findings)
         return pydise_object.side_effects
     except PydiseLoadError:
         print(f"!!! - {filename} -> unable to read the file (maybe python2 ?)")
 
 
+def merge(argv=None):
+    """Merge the result files of several shards into one report."""
+    parser = argparse.ArgumentParser(prog="pydise merge")
+    parser.add_argument("results", help="result files to merge", type=str, nargs="+")
+    parser.add_argument(
+        "--output",
+        help="write the merged results to a json file.",
+        type=str,
+    )
+    args = parser.parse_args(argv)
+
+    list_files = list()
+    findings = list()
+    shards = dict()
+    for path in args.results:
+        try:
+            with open(path) as file:
+                results = json.load(file)
+        except (OSError, json.JSONDecodeError) as exc:
+            parser.error(f"{path} : unable to read the results ({exc}).")
+        if results.get("shard"):
+            try:
+                shard = parse_shard(results["shard"])
+            except argparse.ArgumentTypeError as exc:
+                parser.error(f"{path} : {exc}")
+            if shard in shards:
+                parser.error(f"{path} : shard {results['shard']} already merged from {shards[shard]}.")
+            shards[shard] = path
+        list_files.extend(results.get("files") or list())
+        findings.extend(results.get("findings", list()))
+
+    counts = sorted(set(count for index, count in shards))
+    if len(counts) > 1:
+        parser.error(f"shards of different splits can't be merged : {', '.join(f'N={x}' for x in counts)}")
+
+    for finding in findings:
+        logging.log(logging.getLevelName(finding["level"]), format_finding(finding))
+
+    if args.output:
+        write_results(args.output, findings, list_files=sorted(set(list_files)))
+
+    # A shard which crashed before writing its results must not pass the scan.
+    missing = list()
+    if counts:
+        missing = [f"{x}/{counts[0]}" for x in range(1, counts[0] + 1) if (x, counts[0]) not in shards]
+    if missing:
+        logging.error(f"Missing shards : {', '.join(missing)}")
+    if missing or any(finding["level"] == "ERROR" for finding in findings):
+        exit(1)
+
+
 def run():
     """Run."""
+    if sys.argv[1:2] == ["merge"]:
+        merge(sys.argv[2:])
+        exit(0)
+
     parser = argparse.ArgumentParser()
     # parser.add_argument("--filename", help="file to check")
     parser.add_argument(
@@ -339,9 +999,22 @@ def run():
         "the pattern is added to the default patterns.",
         action="append",
     )
+    parser.add_argument(
+        "--shard",
+        help="only check the K-th of N parts of the detected files (K/N), "
+        "the results can be combined with 'pydise merge'.",
+        type=parse_shard,
+    )
+    parser.add_argument(
+        "--output",
+        help="write the results to a json file.",
+        type=str,
+    )
     args = parser.parse_args()
 
     list_files = get_filenames(args)
+    if args.shard:
+        list_files = get_shard(list_files, args.shard)
 
     if args.list_only:
         print("Detected files : ")
@@ -350,11 +1023,18 @@ def run():
         exit(0)
 
     list_file_side_effects = list()
+    findings = list()
     for path in list_files:
         side_effects = main(
-            filename=path, on_error="logger", pattern_ignored=args.pattern_ignored
+            filename=path,
+            on_error="logger",
+            pattern_ignored=args.pattern_ignored,
+            findings=findings,
         )
-        list_file_side_effects.extend(list(set(side_effects.get("errors", list()))))
+        if side_effects:
+            list_file_side_effects.extend(list(set(side_effects.get("errors", list()))))
+    if args.output:
+        write_results(args.output, findings, list_files=list_files, shard=args.shard)
     if len(list_file_side_effects) > 0:
         exit(1)
 
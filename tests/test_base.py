@@ -34,3 +34,19 @@ def test_base_ok(statement_ok):
     pydise_object = pydise.detector.PyDise(file=test_parse)
     pydise_object.analyze()
     pydise_object.notify(on_error="raise")
+
+
+def test_findings_span():
+    test_parse = StringIO('a = 1\nprint("é",\n      "foo")  # comment\n')
+
+    pydise_object = pydise.detector.PyDise(file=test_parse)
+    pydise_object.analyze()
+    findings = pydise_object.get_findings()
+
+    assert len(findings) == 1
+    assert findings[0]["lineno"] == 2
+    assert findings[0]["col_offset"] == 0
+    assert findings[0]["end_lineno"] == 3
+    assert findings[0]["end_col_offset"] == 12
+    assert findings[0]["segment"] == 'print("é",\n      "foo")'
+    assert findings[0]["level"] == "ERROR"
@@ -0,0 +1,102 @@
+import argparse
+import json
+import pytest
+import pydise.detector
+
+list_files = [f"./lib/module_{i}.py" for i in range(50)]
+
+
+@pytest.mark.parametrize("count", [1, 2, 3, 7])
+def test_shard_partition(count):
+    shards = [
+        pydise.detector.get_shard(list_files, (index, count))
+        for index in range(1, count + 1)
+    ]
+
+    assert sorted(sum(shards, [])) == sorted(list_files)
+    assert sum(len(shard) for shard in shards) == len(list_files)
+
+
+@pytest.mark.parametrize("shard", ["0/2", "3/2", "1", "a/b"])
+def test_shard_invalid(shard):
+    with pytest.raises(argparse.ArgumentTypeError):
+        pydise.detector.parse_shard(shard)
+
+
+def test_merge(tmp_path):
+    finding = {
+        "filename": "foo.py",
+        "lineno": 1,
+        "col_offset": 0,
+        "end_lineno": 1,
+        "end_col_offset": 12,
+        "segment": "print('foo')",
+        "level": "ERROR",
+    }
+    pydise.detector.write_results(
+        tmp_path / "1.json", [finding], list_files=["foo.py"], shard=(1, 2)
+    )
+    pydise.detector.write_results(
+        tmp_path / "2.json", [], list_files=["bar.py"], shard=(2, 2)
+    )
+
+    with pytest.raises(SystemExit) as exc_info:
+        pydise.detector.merge(
+            [
+                str(tmp_path / "1.json"),
+                str(tmp_path / "2.json"),
+                "--output",
+                str(tmp_path / "all.json"),
+            ]
+        )
+
+    assert exc_info.value.code == 1
+    with open(tmp_path / "all.json") as file:
+        results = json.load(file)
+    assert results["files"] == ["bar.py", "foo.py"]
+    assert results["findings"] == [finding]
+
+
+def test_merge_missing_shard(tmp_path):
+    pydise.detector.write_results(
+        tmp_path / "1.json", [], list_files=["foo.py"], shard=(1, 4)
+    )
+
+    with pytest.raises(SystemExit) as exc_info:
+        pydise.detector.merge([str(tmp_path / "1.json")])
+
+    assert exc_info.value.code == 1
+
+
+@pytest.mark.parametrize("shards", [[(1, 2), (1, 2)], [(1, 2), (2, 3)]])
+def test_merge_invalid_shards(tmp_path, shards):
+    list_results = list()
+    for i, shard in enumerate(shards):
+        pydise.detector.write_results(tmp_path / f"{i}.json", [], shard=shard)
+        list_results.append(str(tmp_path / f"{i}.json"))
+
+    with pytest.raises(SystemExit) as exc_info:
+        pydise.detector.merge(list_results)
+
+    assert exc_info.value.code == 2
+
+
+def test_merge_bad_shard(tmp_path):
+    with open(tmp_path / "1.json", "w") as file:
+        json.dump({"shard": "5/2", "files": [], "findings": []}, file)
+
+    with pytest.raises(SystemExit) as exc_info:
+        pydise.detector.merge([str(tmp_path / "1.json")])
+
+    assert exc_info.value.code == 2
+
+
+def test_merge_unreadable(tmp_path):
+    with open(tmp_path / "1.json", "w") as file:
+        file.write("{")
+
+    for path in [tmp_path / "1.json", tmp_path / "nope.json"]:
+        with pytest.raises(SystemExit) as exc_info:
+            pydise.detector.merge([str(path)])
+
+        assert exc_info.value.code == 2
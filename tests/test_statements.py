@@ -1,3 +1,4 @@
+import sys
 from io import StringIO
 import pytest
 import pydise.detector
@@ -138,7 +139,6 @@ except Exception:
     pydise_object.notify(on_error="raise")
 
 
-@pytest.mark.skip(reason="Not Implemented")
 def test_except_ko():
     code_test = """
 try:
@@ -154,7 +154,7 @@ except NameError:
         pydise_object.analyze()
         pydise_object.notify(on_error="raise")
 
-    assert ":3 -> Side effects detected" in str(exc_info.value)
+    assert ":5 -> Side effects detected" in str(exc_info.value)
 
 
 def test_except_ok():
@@ -170,3 +170,199 @@ except NameError:
     pydise_object = pydise.detector.PyDise(file=test_parse)
     pydise_object.analyze()
     pydise_object.notify(on_error="raise")
+
+
+def test_finally_ko():
+    code_test = """
+try:
+    pass
+finally:
+    print("foo")
+"""
+
+    test_parse = StringIO(code_test)
+
+    with pytest.raises(pydise.detector.PydiseSideEffects) as exc_info:
+        pydise_object = pydise.detector.PyDise(file=test_parse)
+        pydise_object.analyze()
+        pydise_object.notify(on_error="raise")
+
+    assert ":5 -> Side effects detected" in str(exc_info.value)
+
+
+def test_try_else_ko():
+    code_test = """
+try:
+    pass
+except Exception:
+    pass
+else:
+    print("foo")
+"""
+
+    test_parse = StringIO(code_test)
+
+    with pytest.raises(pydise.detector.PydiseSideEffects) as exc_info:
+        pydise_object = pydise.detector.PyDise(file=test_parse)
+        pydise_object.analyze()
+        pydise_object.notify(on_error="raise")
+
+    assert ":7 -> Side effects detected" in str(exc_info.value)
+
+
+def test_try_raise():
+    code_test = """
+try:
+    raise ValueError  # no-pydise
+except ValueError:
+    print("foo")
+else:
+    print("bar")
+"""
+
+    test_parse = StringIO(code_test)
+
+    pydise_object = pydise.detector.PyDise(file=test_parse)
+    pydise_object.analyze()
+
+    assert [x["lineno"] for x in pydise_object.get_findings()] == [5]
+
+
+template_match = jinja2.Template(
+    """
+{{ assign }}
+match {{ subject }}:
+    case "foo":
+        print("foo")
+    case ["bar", x] if x == 1:
+        print("bar")
+    case _:
+        print("default")
+"""
+)
+
+list_match = [
+    ("", '"foo"', 5),
+    ("a = 'foo'", "a", 5),
+    ("", '("bar", 1)', 7),
+    ("", '("bar", 2)', 9),
+    ("", "unknown.attribute", 9),
+]
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="Match needs python 3.10")
+@pytest.mark.parametrize("assign, subject, lineno", list_match)
+def test_match(assign, subject, lineno):
+    code_test = jinja2.Template.render(template_match, assign=assign, subject=subject)
+
+    test_parse = StringIO(code_test)
+
+    pydise_object = pydise.detector.PyDise(file=test_parse)
+    pydise_object.analyze()
+
+    assert [x["lineno"] for x in pydise_object.get_findings()] == [lineno]
+
+
+template_try_raise = jinja2.Template(
+    """
+try:
+    if {{ condition }}:
+        raise {{ exception }}  # no-pydise
+except {{ handler }}:
+    print("foo")
+except Exception:
+    print("bar")
+"""
+)
+
+list_try_raise = [
+    ("True", "ValueError", "ValueError", [6]),
+    ("True", "ValueError('foo')", "(TypeError, ValueError)", [6]),
+    ("True", "KeyError", "LookupError", [6]),
+    ("True", "TypeError", "ValueError", [8]),
+    ("True", "MyError", "ValueError", [6, 8]),
+    ("False", "ValueError", "ValueError", []),
+]
+
+
+@pytest.mark.parametrize("condition, exception, handler, list_lineno", list_try_raise)
+def test_try_raise_handlers(condition, exception, handler, list_lineno):
+    code_test = jinja2.Template.render(
+        template_try_raise, condition=condition, exception=exception, handler=handler
+    )
+
+    test_parse = StringIO(code_test)
+
+    pydise_object = pydise.detector.PyDise(file=test_parse)
+    pydise_object.analyze()
+
+    assert [x["lineno"] for x in pydise_object.get_findings()] == list_lineno
+
+
+template_try_may_raise = jinja2.Template(
+    """
+try:
+    {{ body }}
+except Exception:
+    print("foo")
+else:
+    print("bar")
+"""
+)
+
+list_try_may_raise = [
+    ("import foo", [5, 7]),
+    ("a = foo()", [5, 7]),
+    ("a = b.c", [5, 7]),
+    ("a = b", [5, 7]),
+    ("a = 1", [7]),
+    ("pass", [7]),
+]
+
+
+@pytest.mark.parametrize("body, list_lineno", list_try_may_raise)
+def test_try_may_raise(body, list_lineno):
+    code_test = jinja2.Template.render(template_try_may_raise, body=body)
+
+    test_parse = StringIO(code_test)
+
+    pydise_object = pydise.detector.PyDise(file=test_parse)
+    pydise_object.analyze()
+
+    assert [x["lineno"] for x in pydise_object.get_findings()] == list_lineno
+
+
+template_try_nested_raise = jinja2.Template(
+    """
+try:
+{{ body }}
+except ValueError:
+    print("foo")
+except TypeError:
+    print("bar")
+"""
+)
+
+list_try_nested_raise = [
+    "    for i in [1, 2]:\n        raise ValueError  # no-pydise",
+    "    while True:\n        raise ValueError  # no-pydise",
+    "    try:\n        pass\n    finally:\n        raise ValueError  # no-pydise",
+    "    try:\n        raise ValueError  # no-pydise\n    finally:\n        pass",
+]
+if sys.version_info >= (3, 10):
+    list_try_nested_raise.append(
+        "    match 1:\n        case 1:\n            raise ValueError  # no-pydise"
+    )
+
+
+@pytest.mark.parametrize("body", list_try_nested_raise)
+def test_try_nested_raise(body):
+    code_test = jinja2.Template.render(template_try_nested_raise, body=body)
+
+    test_parse = StringIO(code_test)
+
+    pydise_object = pydise.detector.PyDise(file=test_parse)
+    pydise_object.analyze()
+
+    findings = pydise_object.get_findings()
+    assert [x["segment"] for x in findings] == ['print("foo")']
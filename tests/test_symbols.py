@@ -0,0 +1,70 @@
+from io import StringIO
+import pytest
+import pydise.detector
+
+list_ko = [
+    ("def foo():\n    print('foo')\nlog = foo\na = log()\n", 2),
+    ("class Foo:\n    def bar(self):\n        print('foo')\nobj = Foo()\na = obj.bar()\n", 3),
+    ("class Foo:\n    def bar(self):\n        print('foo')\na = Foo.bar()\n", 3),
+    ("a, b = True, False\nif a:\n    print('foo')\n", 3),
+    ("a = 0\na += 1\nif a:\n    print('foo')\n", 4),
+    ("a = True\nb = a\na = False\nif b:\n    print('foo')\n", 5),
+    ("a = False\nfor a in [True]:\n    pass\nif a:\n    print('foo')\n", 5),
+    ("a = True\nfor a in []:\n    pass\nif a:\n    print('foo')\n", 5),
+    ("if (a := True):\n    pass\nif a:\n    print('foo')\n", 4),
+]
+
+list_ok = [
+    "a, b = True, False\nif b:\n    print('foo')\n",
+    "a = True\na = False\nif a:\n    print('foo')\n",
+    "a = True\nfrom foo import a\nif a:\n    print('foo')\n",
+    "def foo():\n    a = foo()\na = foo()\n",
+    "a = True\nfor a in [False]:\n    pass\nif a:\n    print('foo')\n",
+    "a = True\nfor a in foo():\n    pass\nif a:\n    print('foo')\n",
+    "a = True\nwith foo() as a:\n    pass\nif a:\n    print('foo')\n",
+    "a = True\ndel a  # no-pydise\nif a:\n    print('foo')\n",
+    "a = True\ntry:\n    raise ValueError  # no-pydise\nexcept ValueError as a:\n    pass\nif a:\n    print('foo')\n",
+    "foo = 1\nasync def foo():\n    pass\nif foo:\n    print('foo')\n",
+    "if json:\n    print('foo')\n",
+    "f = lambda: (a := 1)\nif a:\n    print('foo')\n",
+    "a = exit()\nif not a:\n    print('foo')\n",
+    "a = input()\nif a + '':\n    print('foo')\n",
+]
+
+
+@pytest.mark.parametrize("statement_ko, lineno", list_ko)
+def test_symbols_ko(statement_ko, lineno):
+    test_parse = StringIO(statement_ko)
+
+    with pytest.raises(pydise.detector.PydiseSideEffects) as exc_info:
+        pydise_object = pydise.detector.PyDise(file=test_parse)
+        pydise_object.analyze()
+        pydise_object.notify(on_error="raise")
+
+    assert f":{lineno} -> Side effects detected :" in str(exc_info.value)
+
+
+@pytest.mark.parametrize("statement_ok", list_ok)
+def test_symbols_ok(statement_ok):
+    test_parse = StringIO(statement_ok)
+
+    pydise_object = pydise.detector.PyDise(file=test_parse)
+    pydise_object.analyze()
+    pydise_object.notify(on_error="raise")
+
+
+def test_symbols_def_use():
+    test_parse = StringIO(
+        "a = 1\nb = a\na = 2\nc = a\nif a:\n    pass\na += 1\n"
+        "def foo():\n    x = a()\nd = foo()\nd = foo()\n"
+    )
+
+    pydise_object = pydise.detector.PyDise(file=test_parse)
+    pydise_object.analyze()
+    first_a, second_a, third_a = pydise_object.symbols.symbols["a"]
+
+    assert [x.lineno for x in first_a.uses] == [2]
+    assert [x.lineno for x in second_a.uses] == [4, 5, 7]
+    assert [x.lineno for x in third_a.uses] == [9]
+    assert pydise_object.symbols.lookup("b").reaching["a"] is first_a
+    assert third_a.reaching["a"] is second_a